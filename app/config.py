@@ -4,3 +4,7 @@ from dotenv import load_dotenv
 load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
+# Логировать каждый N-й SQL-запрос (0 — логирование SQL выключено)
+SQL_LOG_SAMPLE_EVERY = int(os.getenv("SQL_LOG_SAMPLE_EVERY", "0"))
+# Подключение через PgBouncer в режиме transaction pooling
+USE_PGBOUNCER = os.getenv("USE_PGBOUNCER", "false").lower() == "true"
@@ -16,7 +16,7 @@ def get_db() -> Session:
 
 
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.database import async_session_maker
 
 
@@ -26,3 +26,11 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session_maker() as session:
         yield session
+
+
+def get_async_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Предоставляет фабрику асинхронных сессий для потоковых ответов,
+    которым сессия нужна дольше, чем живёт зависимость get_async_db.
+    """
+    return async_session_maker
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.routers import categories, products, users, reviews
 
@@ -7,6 +8,7 @@ from app.routers import categories, products, users, reviews
 app = FastAPI(
     title="FastAPI Интернет-магазин",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Подключаем маршруты категорий
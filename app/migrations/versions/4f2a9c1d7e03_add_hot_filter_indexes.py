@@ -0,0 +1,47 @@
+"""Add hot filter indexes
+
+Revision ID: 4f2a9c1d7e03
+Revises: 191d5092ad98
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c1d7e03'
+down_revision: Union[str, Sequence[str], None] = '191d5092ad98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_products_category_active', 'products', ['category_id'], unique=False,
+            postgresql_where=sa.text('is_active'), postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_products_seller', 'products', ['seller_id'], unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_reviews_product_active', 'reviews', ['product_id'], unique=False,
+            postgresql_where=sa.text('is_active'), postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_reviews_product_active', table_name='reviews',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_products_seller', table_name='products',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_products_category_active', table_name='products',
+                      postgresql_concurrently=True)
@@ -0,0 +1,64 @@
+"""Add product rating trigger
+
+Revision ID: a71e5b3c9d24
+Revises: 4f2a9c1d7e03
+Create Date: 2026-10-14 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a71e5b3c9d24'
+down_revision: Union[str, Sequence[str], None] = '4f2a9c1d7e03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # products.rating поддерживается базой: пересчёт при любом изменении отзывов
+    op.execute("""
+        CREATE OR REPLACE FUNCTION recalc_product_rating(p_product_id integer)
+        RETURNS void AS $$
+            UPDATE products
+            SET rating = COALESCE(
+                (SELECT avg(grade) FROM reviews
+                 WHERE product_id = p_product_id AND is_active),
+                0.0
+            )
+            WHERE id = p_product_id;
+        $$ LANGUAGE sql;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION reviews_update_product_rating()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM recalc_product_rating(NEW.product_id);
+            ELSIF TG_OP = 'DELETE' THEN
+                PERFORM recalc_product_rating(OLD.product_id);
+            ELSE
+                PERFORM recalc_product_rating(NEW.product_id);
+                IF NEW.product_id <> OLD.product_id THEN
+                    PERFORM recalc_product_rating(OLD.product_id);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_reviews_product_rating
+        AFTER INSERT OR DELETE OR UPDATE OF grade, is_active, product_id ON reviews
+        FOR EACH ROW EXECUTE FUNCTION reviews_update_product_rating();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_reviews_product_rating ON reviews;")
+    op.execute("DROP FUNCTION IF EXISTS reviews_update_product_rating();")
+    op.execute("DROP FUNCTION IF EXISTS recalc_product_rating(integer);")
@@ -0,0 +1,36 @@
+"""Review comment_date server default
+
+Revision ID: d5c8e2f41b6a
+Revises: a71e5b3c9d24
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5c8e2f41b6a'
+down_revision: Union[str, Sequence[str], None] = 'a71e5b3c9d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('reviews', 'comment_date',
+                    existing_type=sa.DateTime(),
+                    type_=sa.DateTime(timezone=True),
+                    server_default=sa.text('now()'),
+                    existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('reviews', 'comment_date',
+                    existing_type=sa.DateTime(timezone=True),
+                    type_=sa.DateTime(),
+                    server_default=None,
+                    existing_nullable=False)
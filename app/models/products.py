@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Float, Integer
+from sqlalchemy import String, Boolean, Float, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey
 
@@ -7,6 +7,14 @@ from app.database import Base
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index(
+            "ix_products_category_active",
+            "category_id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_products_seller", "seller_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
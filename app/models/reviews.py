@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, Text, CheckConstraint, Integer, DateTime, Boolean
+from sqlalchemy import (
+    ForeignKey, Text, CheckConstraint, Integer, DateTime, Boolean, Index, text, func, event, DDL
+)
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from datetime import datetime
 
@@ -7,12 +9,21 @@ from app.database import Base
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index(
+            "ix_reviews_product_active",
+            "product_id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     product_id: Mapped[int] = mapped_column(Integer, ForeignKey("products.id"), nullable=False)
     comment: Mapped[str | None] = mapped_column(Text)
-    comment_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
+    comment_date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     grade: Mapped[int] = mapped_column(
         Integer,
         CheckConstraint("grade >= 1 AND grade <= 5", name="check_grade_comment"),
@@ -22,3 +33,55 @@ class Review(Base):
 
     buyer: Mapped["User"] = relationship("User", back_populates="reviews")
     product: Mapped["Product"] = relationship("Product", back_populates="reviews")
+
+
+# products.rating поддерживается триггером PostgreSQL (см. миграцию a71e5b3c9d24).
+# Те же объекты создаются и при Base.metadata.create_all; на других СУБД
+# (например, SQLite в тестах) рейтинг товара автоматически не пересчитывается.
+RATING_TRIGGER_DDL = (
+    DDL("""
+        CREATE OR REPLACE FUNCTION recalc_product_rating(p_product_id integer)
+        RETURNS void AS $$
+            UPDATE products
+            SET rating = COALESCE(
+                (SELECT avg(grade) FROM reviews
+                 WHERE product_id = p_product_id AND is_active),
+                0.0
+            )
+            WHERE id = p_product_id;
+        $$ LANGUAGE sql;
+    """),
+    DDL("""
+        CREATE OR REPLACE FUNCTION reviews_update_product_rating()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM recalc_product_rating(NEW.product_id);
+            ELSIF TG_OP = 'DELETE' THEN
+                PERFORM recalc_product_rating(OLD.product_id);
+            ELSE
+                PERFORM recalc_product_rating(NEW.product_id);
+                IF NEW.product_id <> OLD.product_id THEN
+                    PERFORM recalc_product_rating(OLD.product_id);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """),
+    DDL("""
+        CREATE TRIGGER trg_reviews_product_rating
+        AFTER INSERT OR DELETE OR UPDATE OF grade, is_active, product_id ON reviews
+        FOR EACH ROW EXECUTE FUNCTION reviews_update_product_rating();
+    """),
+)
+DROP_RATING_FUNCTIONS_DDL = (
+    DDL("DROP FUNCTION IF EXISTS reviews_update_product_rating();"),
+    DDL("DROP FUNCTION IF EXISTS recalc_product_rating(integer);"),
+)
+
+for ddl in RATING_TRIGGER_DDL:
+    event.listen(Review.__table__, "after_create", ddl.execute_if(dialect="postgresql"))
+# Триггер удаляется вместе с таблицей, функции — отдельно
+for ddl in DROP_RATING_FUNCTIONS_DDL:
+    event.listen(Review.__table__, "after_drop", ddl.execute_if(dialect="postgresql"))
@@ -0,0 +1,87 @@
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession, async_sessionmaker
+from starlette.background import BackgroundTask
+
+
+STREAM_BATCH_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """
+    Возвращает TypeAdapter для типа, создавая его один раз на процесс.
+    """
+    return TypeAdapter(tp)
+
+
+def dump_json_list(rows: Iterable[Any], schema: type[BaseModel]) -> bytes:
+    """
+    Сериализует ORM-объекты в JSON-массив за один проход pydantic-core.
+    """
+    adapter = type_adapter(list[schema])
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def json_list_response(rows: Iterable[Any], schema: type[BaseModel]) -> Response:
+    """
+    Возвращает готовый JSON-ответ со списком объектов schema,
+    минуя повторную валидацию и сериализацию на стороне FastAPI.
+    """
+    return Response(dump_json_list(rows, schema), media_type="application/json")
+
+
+async def _iter_json_array(
+        session: AsyncSession,
+        result: AsyncScalarResult,
+        adapter: TypeAdapter,
+) -> AsyncIterator[bytes]:
+    """
+    Построчно отдаёт уже выполненный запрос частями как JSON-массив
+    и закрывает сессию по окончании.
+    """
+    try:
+        yield b"["
+        separator = b""
+        async for row in result:
+            yield separator + adapter.dump_json(
+                adapter.validate_python(row, from_attributes=True)
+            )
+            separator = b","
+        yield b"]"
+    finally:
+        await session.close()
+
+
+async def stream_json_list(
+        session_maker: async_sessionmaker[AsyncSession],
+        stmt: Select,
+        schema: type[BaseModel],
+) -> StreamingResponse:
+    """
+    Возвращает потоковый ответ со списком объектов schema без загрузки
+    всего результата в память.
+    Запрос выполняется до начала ответа, чтобы ошибка базы данных
+    превратилась в 5xx, а не в обрезанное тело со статусом 200.
+    Сессия создаётся отдельно: зависимость get_async_db закрывается
+    раньше, чем начинается отправка тела ответа.
+    """
+    session = session_maker()
+    try:
+        result = await session.stream_scalars(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+    except BaseException:
+        await session.close()
+        raise
+    return StreamingResponse(
+        _iter_json_array(session, result, type_adapter(schema)),
+        media_type="application/json",
+        # Закрывает сессию, если генератор так и не был запущен
+        background=BackgroundTask(session.close),
+    )
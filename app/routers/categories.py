@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, update
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, update, insert, exists
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.categories import Category as CategoryModel
 from app.schemas import Category as CategorySchema, CategoryCreate
 from app.db_depends import get_async_db
+from app.responses import dump_json_list
 
 
 # Создаём маршрутизатор с префиксом и тегом
@@ -13,17 +17,44 @@ router = APIRouter(
     tags=["categories"],
 )
 
+# Кэш списка активных категорий: (момент истечения, готовое JSON-тело)
+CATEGORIES_CACHE_TTL = 30.0
+_categories_cache: tuple[float, bytes] | None = None
+# Номер поколения кэша: увеличивается при каждой инвалидации
+_categories_cache_generation = 0
+
+
+def invalidate_categories_cache() -> None:
+    """
+    Сбрасывает кэш списка категорий после любого изменения.
+    """
+    global _categories_cache, _categories_cache_generation
+    _categories_cache = None
+    _categories_cache_generation += 1
+
 
 @router.get("/", response_model=list[CategorySchema])
 async def get_all_categories(db: AsyncSession = Depends(get_async_db)):
     """
     Возвращает список всех категорий товаров.
     """
+    global _categories_cache
+    cache = _categories_cache
+    now = time.monotonic()
+    if cache is not None and cache[0] > now:
+        return Response(cache[1], media_type="application/json")
+
+    generation = _categories_cache_generation
     result = await db.scalars(
-        select(CategoryModel).where(CategoryModel.is_active == True)
+        select(CategoryModel)
+        .options(raiseload("*"))
+        .where(CategoryModel.is_active == True)
     )
-    categories = result.all()
-    return categories
+    body = dump_json_list(result.all(), CategorySchema)
+    # Если за время запроса кэш инвалидировали, результат мог устареть
+    if generation == _categories_cache_generation:
+        _categories_cache = (now + CATEGORIES_CACHE_TTL, body)
+    return Response(body, media_type="application/json")
 
 
 @router.post("/", response_model=CategorySchema, status_code=status.HTTP_201_CREATED)
@@ -36,17 +67,22 @@ async def create_category(
     """
     # Проверка существования parent_id, если указан
     if category.parent_id is not None:
-        result = await db.scalars(select(CategoryModel).where(CategoryModel.id == category.parent_id))
-        parent = result.first()
-        if parent is None:
+        parent_exists = await db.scalar(
+            select(exists().where(CategoryModel.id == category.parent_id))
+        )
+        if not parent_exists:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Parent category not found")
 
     # Создание новой категории
-    db_category = CategoryModel(**category.model_dump())
-    db.add(db_category)
+    # INSERT ... RETURNING вместо add() + refresh()
+    db_category = await db.scalar(
+        insert(CategoryModel)
+        .values(**category.model_dump())
+        .returning(CategoryModel)
+    )
     await db.commit()
-    await db.refresh(db_category)
+    invalidate_categories_cache()
     return db_category
 
 
@@ -59,34 +95,31 @@ async def update_category(
     """
     Обновляет категорию по её ID.
     """
-    result = await db.scalars(
-        select(CategoryModel).where(CategoryModel.id == category_id)
-    )
-    db_category = result.first()
-    if not db_category:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
-                            detail="Category not found")
-
     if category.parent_id is not None:
-        parent_result = await db.scalars(
-            select(CategoryModel).where(CategoryModel.id == category.parent_id)
+        if category.parent_id == category_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="Category cannot be its own parent")
+        parent_exists = await db.scalar(
+            select(exists().where(CategoryModel.id == category.parent_id))
         )
-        parent = parent_result.first()
-        if parent is None:
+        if not parent_exists:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Parent category not found")
-        if parent.id == category_id:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
-                                detail="Category cannot be its own parent")
 
+    # UPDATE ... RETURNING: проверка существования и новые данные за один запрос
     update_data = category.model_dump(exclude_unset=True)
-    await db.execute(
+    result = await db.execute(
         update(CategoryModel)
         .where(CategoryModel.id == category_id)
         .values(**update_data)
+        .returning(CategoryModel)
     )
+    db_category = result.scalar_one_or_none()
+    if db_category is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Category not found")
     await db.commit()
-    await db.refresh(db_category)
+    invalidate_categories_cache()
 
     return db_category
 
@@ -96,18 +129,15 @@ async def delete_category(category_id: int, db: AsyncSession = Depends(get_async
     """
     Удаляет категорию по её ID.
     """
-    result = await db.scalar(
-        select(CategoryModel.id).where(
-            CategoryModel.id == category_id,
-            CategoryModel.is_active == True,
-        )
-    )
-    category = result.first()
-    if category is None:
-        raise HTTPException(status_code=400, detail="Category not found")
-
-    await db.execute(
-        update(CategoryModel).where(CategoryModel.id == category_id).values(is_active=False)
+    result = await db.execute(
+        update(CategoryModel)
+        .where(CategoryModel.id == category_id, CategoryModel.is_active == True)
+        .values(is_active=False)
+        .returning(CategoryModel.id)
     )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                            detail="Category not found")
     await db.commit()
+    invalidate_categories_cache()
     return {"status": "success", "message": "Category marked as inactive"}
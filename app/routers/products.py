@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, update
-
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, bindparam, exists
+from sqlalchemy.orm import contains_eager, raiseload
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.auth import get_current_seller
 from app.models import (
@@ -11,7 +11,8 @@ from app.models import (
     Review as ReviewModel
 )
 from app.schemas import Product as ProductSchema, ProductCreate, Review as ReviewSchema
-from app.db_depends import get_async_db
+from app.db_depends import get_async_db, get_async_session_maker
+from app.responses import stream_json_list, json_list_response
 
 
 # Создаём маршрутизатор для товаров
@@ -20,21 +21,40 @@ router = APIRouter(
     tags=["products"],
 )
 
+# Запросы горячих эндпоинтов строятся один раз при импорте модуля;
+# значения передаются через bindparam при выполнении.
+_PRODUCT_BY_ID_STMT = (
+    select(ProductModel)
+    .join(CategoryModel)
+    .options(contains_eager(ProductModel.category))
+    .where(
+        ProductModel.id == bindparam("product_id"),
+        ProductModel.is_active == True,
+        CategoryModel.is_active == True,
+    )
+)
+_PRODUCTS_BY_CATEGORY_STMT = select(ProductModel).where(
+    ProductModel.category_id == bindparam("category_id"),
+    ProductModel.is_active == True,
+)
+
 
 @router.get("/", response_model=list[ProductSchema])
-async def get_all_products(db: AsyncSession = Depends(get_async_db)):
+async def get_all_products(
+        session_maker: async_sessionmaker[AsyncSession] = Depends(get_async_session_maker)
+):
     """
     Возвращает список всех товаров.
     """
-    result = await db.scalars(
+    return await stream_json_list(
+        session_maker,
         select(ProductModel).join(CategoryModel).where(
             ProductModel.is_active == True,
             CategoryModel.is_active == True,
             ProductModel.stock > 0,
-        )
+        ),
+        ProductSchema,
     )
-    products = result.all()
-    return products
 
 
 @router.post("/", response_model=ProductSchema, status_code=status.HTTP_201_CREATED)
@@ -46,23 +66,25 @@ async def create_product(
     """
     Создаёт новый товар, привязанный к текущему продавцу (только для 'seller').
     """
-    rs_category = await db.scalars(
-        select(CategoryModel).where(
+    category_exists = await db.scalar(
+        select(exists().where(
             CategoryModel.id == product.category_id,
             CategoryModel.is_active == True
-        )
+        ))
     )
-    category = rs_category.first()
-    if not category:
+    if not category_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category not found or inactive",
         )
 
-    db_product = ProductModel(**product.model_dump(), seller_id=current_user.id)
-    db.add(db_product)
+    # INSERT ... RETURNING вместо add() + refresh()
+    db_product = await db.scalar(
+        insert(ProductModel)
+        .values(**product.model_dump(), seller_id=current_user.id)
+        .returning(ProductModel)
+    )
     await db.commit()
-    await db.refresh(db_product)
 
     return db_product
 
@@ -75,28 +97,24 @@ async def get_products_by_category(
     """
     Возвращает список товаров в указанной категории по её ID.
     """
-    rs_category = await db.scalars(
-        select(CategoryModel).where(
-        CategoryModel.id == category_id,
-        CategoryModel.is_active == True,
-        )
+    category_exists = await db.scalar(
+        select(exists().where(
+            CategoryModel.id == category_id,
+            CategoryModel.is_active == True,
+        ))
     )
-    category = rs_category.first()
-    if not category:
+    if not category_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category not found or inactive",
         )
 
     rs_products = await db.scalars(
-        select(ProductModel).where(
-            ProductModel.category_id == category_id,
-            ProductModel.is_active == True
-        )
+        _PRODUCTS_BY_CATEGORY_STMT, {"category_id": category_id}
     )
     products = rs_products.all()
 
-    return products
+    return json_list_response(products, ProductSchema)
 
 
 @router.get("/{product_id}", response_model=ProductSchema)
@@ -107,24 +125,12 @@ async def get_product(
     """
     Возвращает детальную информацию о товаре по его ID.
     """
-    rs_product = await db.scalars(
-        select(ProductModel).where(ProductModel.id == product_id, ProductModel.is_active == True)
-    )
+    rs_product = await db.scalars(_PRODUCT_BY_ID_STMT, {"product_id": product_id})
     product = rs_product.first()
     if not product:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
-
-    rs_category = await db.scalars(
-        select(CategoryModel).where(
-            CategoryModel.id == product.category_id,
-            CategoryModel.is_active == True,
-        )
-    )
-    category = rs_category.first()
-    if not category:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Category not found or inactive",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found or category inactive",
         )
 
     return product
@@ -140,44 +146,48 @@ async def update_product(
     """
     Обновляет товар, если он принадлежит текущему продавцу (только для 'seller').
     """
-    rs_db_product = await db.scalars(
-        select(ProductModel).where(
+    # Товар и активность новой категории проверяются одним запросом
+    category_exists = (
+        select(CategoryModel.id)
+        .where(
+            CategoryModel.id == product.category_id,
+            CategoryModel.is_active == True
+        )
+        .exists()
+    )
+    rs_db_product = await db.execute(
+        select(ProductModel, category_exists).where(
             ProductModel.id == product_id,
             ProductModel.is_active == True,
         )
     )
-    db_product = rs_db_product.first()
-    if not db_product:
+    row = rs_db_product.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
+    db_product, category_is_active = row
     if db_product.seller_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only update your own products"
         )
-
-    rs_category = await db.scalars(
-        select(CategoryModel).where(
-            CategoryModel.id == product.category_id,
-            CategoryModel.is_active == True
-        )
-    )
-    category = rs_category.first()
-    if category is None:
+    if not category_is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category not found or inactive",
         )
 
-    await db.execute(
+    # RETURNING отдаёт обновлённую строку без дополнительного refresh()
+    rs_updated = await db.execute(
         update(ProductModel)
         .where(ProductModel.id == product_id)
         .values(**product.model_dump())
+        .returning(ProductModel)
     )
+    db_product = rs_updated.scalar_one()
     await db.commit()
-    await db.refresh(db_product)
 
     return db_product
 
@@ -191,46 +201,39 @@ async def delete_product(
     """
     Удаляет товар по его ID.
     """
-    rs_product = await db.scalars(
-        select(ProductModel).where(
+    # Все проверки внутри WHERE: успешное удаление — один запрос
+    rs_product = await db.execute(
+        update(ProductModel)
+        .where(
             ProductModel.id == product_id,
             ProductModel.is_active == True,
-            ProductModel.price.between()
+            ProductModel.seller_id == current_user.id,
+            ProductModel.category_id.in_(
+                select(CategoryModel.id).where(CategoryModel.is_active == True)
+            ),
         )
+        .values(is_active=False)
+        .returning(ProductModel)
     )
-    product = rs_product.first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
+    product = rs_product.scalar_one_or_none()
+    if product is None:
+        # Строка не обновлена — выясняем причину для корректного ответа
+        seller_id = await db.scalar(
+            select(ProductModel.seller_id).where(
+                ProductModel.id == product_id,
+                ProductModel.is_active == True,
+            )
         )
-    if product.seller_id != current_user.id:
+        if seller_id is not None and seller_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only update your own products"
+            )
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your own products"
-        )
-
-    rs_category = await db.scalars(
-        select(CategoryModel).where(
-            CategoryModel.id == product.category_id,
-            CategoryModel.is_active == True,
-
-        )
-    )
-    category = rs_category.first()
-    if category is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Category not found or inactive",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found or category inactive",
         )
-
-    await db.execute(
-        update(ProductModel)
-        .where(ProductModel.id == product_id)
-        .values(is_active=False)
-    )
     await db.commit()
-    await db.refresh(product)
 
     return product
 
@@ -240,23 +243,28 @@ async def get_reviews(
         product_id: int,
         db: AsyncSession = Depends(get_async_db)
 ):
-    rs_product = await db.scalars(
-        select(ProductModel).where(
+    rs_reviews = await db.scalars(
+        select(ReviewModel)
+        .join(ProductModel)
+        .options(raiseload("*"))
+        .where(
             ProductModel.id == product_id,
             ProductModel.is_active == True,
-        )
-    )
-    product = rs_product.first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found",
-        )
-    rs_reviews = await db.scalars(
-        select(ReviewModel).where(
             ReviewModel.is_active == True,
-            ReviewModel.product_id == product.id,
         )
     )
     reviews = rs_reviews.all()
-    return reviews
+    if not reviews:
+        # Пустой результат: отличаем "нет отзывов" от "нет товара"
+        product_id_db = await db.scalar(
+            select(ProductModel.id).where(
+                ProductModel.id == product_id,
+                ProductModel.is_active == True,
+            )
+        )
+        if product_id_db is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found",
+            )
+    return json_list_response(reviews, ReviewSchema)
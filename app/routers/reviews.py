@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, update, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, bindparam
+from sqlalchemy.orm import raiseload
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db_depends import get_async_db
+from app.db_depends import get_async_db, get_async_session_maker
+from app.responses import stream_json_list
 from app.auth import get_current_user, get_current_admin
 from app.models import (
     Review as ReviewModel,
@@ -17,17 +19,46 @@ router = APIRouter(
     tags=["reviews"]
 )
 
+# INSERT ... SELECT ... WHERE EXISTS: проверка товара и вставка одним запросом.
+# Строится один раз при импорте, значения передаются через bindparam.
+_CREATE_REVIEW_STMT = (
+    insert(ReviewModel)
+    .from_select(
+        ["user_id", "product_id", "comment", "grade"],
+        select(
+            bindparam("user_id", type_=ReviewModel.user_id.type),
+            bindparam("product_id", type_=ReviewModel.product_id.type),
+            bindparam("comment", type_=ReviewModel.comment.type),
+            bindparam("grade", type_=ReviewModel.grade.type),
+        ).where(
+            select(ProductModel.id)
+            .where(
+                ProductModel.is_active == True,
+                ProductModel.id == bindparam("product_id"),
+            )
+            .exists()
+        ),
+    )
+    .returning(ReviewModel)
+)
+# Через from_statement ORM собирает объект Review из колонок RETURNING
+_CREATE_REVIEW_ORM_STMT = select(ReviewModel).from_statement(_CREATE_REVIEW_STMT)
+
 
 @router.get("/", response_model=list[ReviewSchema])
-async def get_reviews(db: AsyncSession = Depends(get_async_db)):
+async def get_reviews(
+        session_maker: async_sessionmaker[AsyncSession] = Depends(get_async_session_maker)
+):
     """
     Получение всех комментариев по всем товарам
     """
-    rs_reviews = await db.scalars(
-        select(ReviewModel).where(ReviewModel.is_active == True)
+    return await stream_json_list(
+        session_maker,
+        select(ReviewModel)
+        .options(raiseload("*"))
+        .where(ReviewModel.is_active == True),
+        ReviewSchema,
     )
-    reviews = rs_reviews.all()
-    return reviews
 
 
 @router.post("/", response_model=ReviewSchema, status_code=status.HTTP_201_CREATED)
@@ -44,31 +75,24 @@ async def create_review(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Только аутентифицированные пользователи с ролью \"buyer\""
         )
-    if review.grade < 1 or review.grade > 5:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="grade вне диапазона [1–5]."
-        )
 
-    rs_product = await db.scalars(
-        select(ProductModel).where(
-            ProductModel.is_active == True,
-            ProductModel.id == review.product_id,
-        )
+    db_review = await db.scalar(
+        _CREATE_REVIEW_ORM_STMT,
+        {
+            "user_id": current_user.id,
+            "product_id": review.product_id,
+            "comment": review.comment,
+            "grade": review.grade,
+        },
     )
-    product = rs_product.first()
-    if not product:
+    if db_review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or inactive"
         )
 
-    db_review = ReviewModel(**review.model_dump(), user_id=current_user.id)
-    db.add(db_review)
-
+    # products.rating пересчитывает триггер trg_reviews_product_rating
     await db.commit()
-    await db.refresh(db_review)
-    await update_product_rating(db, product.id)
 
     return db_review
 
@@ -82,27 +106,15 @@ async def delete_review(
     """
     Логическое удаление комментария, доступно только пользователям с ролью admin
     """
-    rs_review = await db.scalars(
-        select(ReviewModel).where(
-            ReviewModel.id == review_id,
-            ReviewModel.is_active == True,
-        )
-    )
-    review = rs_review.first()
-    if not review:
+    review = await db.get(ReviewModel, review_id)
+    if review is None or not review.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Review not found or inactive"
         )
 
-    rs_product = await db.scalars(
-        select(ProductModel).where(
-            ProductModel.id == review.product_id,
-            ProductModel.is_active == True,
-        )
-    )
-    product = rs_product.first()
-    if not product:
+    product = await db.get(ProductModel, review.product_id)
+    if product is None or not product.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or inactive"
@@ -112,19 +124,6 @@ async def delete_review(
         update(ReviewModel).where(ReviewModel.id == review.id).values(is_active=False)
     )
     await db.commit()
-    await update_product_rating(db, product.id)
 
     return {"message": "Review deleted"}
 
-
-async def update_product_rating(db: AsyncSession, product_id: int):
-    result = await db.execute(
-        select(func.avg(ReviewModel.grade)).where(
-            ReviewModel.product_id == product_id,
-            ReviewModel.is_active == True
-        )
-    )
-    avg_rating = result.scalar() or 0.0
-    product = await db.get(ProductModel, product_id)
-    product.rating = avg_rating
-    await db.commit()
@@ -84,7 +84,7 @@ class ReviewCreate(BaseModel):
     """
     product_id: int = Field(gt=0, description="Уникальный идентификатор товара")
     comment: Optional[str] = Field(None, description="Содержание комментария")
-    grade: int = Field(description="Оценка товара от 1 до 5")
+    grade: int = Field(ge=1, le=5, description="Оценка товара от 1 до 5")
 
 
 class Review(BaseModel):
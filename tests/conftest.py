@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from app.auth import get_current_user
+from app.database import Base
+from app.db_depends import get_async_db, get_async_session_maker
+from app.main import app
+from app.models import Category as CategoryModel, Product as ProductModel, User as UserModel
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def session_maker():
+    """
+    Фабрика сессий поверх in-memory SQLite с созданными таблицами.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def seed(session_maker):
+    """
+    Покупатель, два продавца и активный товар первого продавца в активной категории.
+    """
+    async with session_maker() as session:
+        buyer = UserModel(email="buyer@example.com", hashed_password="x", role="buyer")
+        seller = UserModel(email="seller@example.com", hashed_password="x", role="seller")
+        other_seller = UserModel(email="other@example.com", hashed_password="x", role="seller")
+        category = CategoryModel(name="Books")
+        session.add_all([buyer, seller, other_seller, category])
+        await session.flush()
+        product = ProductModel(
+            name="Book", price=10.0, stock=5,
+            category_id=category.id, seller_id=seller.id,
+        )
+        session.add(product)
+        await session.commit()
+        return SimpleNamespace(
+            buyer=buyer, seller=seller, other_seller=other_seller,
+            category=category, product=product,
+        )
+
+
+@pytest.fixture
+def buyer(seed):
+    return seed.buyer
+
+
+@pytest.fixture
+def login():
+    """
+    Подменяет аутентифицированного пользователя для последующих запросов.
+    """
+    def _login(user: UserModel) -> None:
+        app.dependency_overrides[get_current_user] = lambda: user
+    return _login
+
+
+@pytest.fixture
+async def client(session_maker, seed, login):
+    """
+    HTTP-клиент приложения с тестовой базой; по умолчанию вошёл покупатель.
+    """
+    async def override_get_async_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_maker] = lambda: session_maker
+    login(seed.buyer)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.clear()
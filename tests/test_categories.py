@@ -0,0 +1,67 @@
+import pytest
+
+from app.routers import categories
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def reset_categories_cache():
+    categories.invalidate_categories_cache()
+    yield
+    categories.invalidate_categories_cache()
+
+
+async def test_create_category_invalidates_cached_list(client):
+    first = await client.get("/categories/")
+    assert [c["name"] for c in first.json()] == ["Books"]
+
+    response = await client.post("/categories/", json={"name": "Games"})
+    assert response.status_code == 201
+
+    second = await client.get("/categories/")
+    assert [c["name"] for c in second.json()] == ["Books", "Games"]
+
+
+async def test_stale_read_is_not_cached_after_concurrent_invalidation(client, monkeypatch):
+    dump_json_list = categories.dump_json_list
+
+    def dump_with_concurrent_write(rows, schema):
+        # Изменение категорий, зафиксированное между SELECT и записью в кэш
+        categories.invalidate_categories_cache()
+        return dump_json_list(rows, schema)
+
+    monkeypatch.setattr(categories, "dump_json_list", dump_with_concurrent_write)
+    response = await client.get("/categories/")
+
+    assert response.status_code == 200
+    assert categories._categories_cache is None
+
+
+async def test_update_missing_category_returns_404(client):
+    response = await client.put("/categories/999", json={"name": "Games"})
+
+    assert response.status_code == 404
+
+
+async def test_update_category_returns_updated_row(client, seed):
+    response = await client.put(f"/categories/{seed.category.id}", json={"name": "Novels"})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Novels"
+
+
+async def test_delete_category_marks_it_inactive(client, seed):
+    response = await client.delete(f"/categories/{seed.category.id}")
+
+    assert response.status_code == 200
+    listing = await client.get("/categories/")
+    assert listing.json() == []
+
+
+async def test_delete_missing_or_inactive_category_returns_404(client, seed):
+    assert (await client.delete("/categories/999")).status_code == 404
+
+    assert (await client.delete(f"/categories/{seed.category.id}")).status_code == 200
+    assert (await client.delete(f"/categories/{seed.category.id}")).status_code == 404
@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.database import SampledFilter
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def sql_log():
+    """
+    Движок SQLite с включённым SQL-логом, прошедшим через SampledFilter(2).
+    """
+    engine = create_engine("sqlite://")
+    sampler = SampledFilter(2)
+    sampler.attach(engine)
+    handler = ListHandler()
+    handler.addFilter(sampler)
+    logger = logging.getLogger("sqlalchemy.engine.Engine")
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    yield engine, handler.messages
+    logger.removeHandler(handler)
+    logger.setLevel(previous_level)
+    sampler.detach(engine)
+    engine.dispose()
+
+
+def test_sampled_filter_keeps_every_nth_statement_with_its_parameters(sql_log):
+    engine, messages = sql_log
+    with engine.connect() as conn:
+        for n in range(1, 5):
+            conn.execute(text(f"select {n} + :x"), {"x": n})
+        conn.commit()
+
+    assert len(messages) == 4
+    assert messages[0] == "select 2 + ?"
+    assert messages[1].startswith("[generated in") and messages[1].endswith("(2,)")
+    assert messages[2] == "select 4 + ?"
+    assert messages[3].endswith("(4,)")
@@ -0,0 +1,29 @@
+from sqlalchemy import create_mock_engine
+
+from app.database import Base
+
+
+def _create_all_ddl(url: str) -> str:
+    statements = []
+    engine = create_mock_engine(
+        url, lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect)))
+    )
+    Base.metadata.create_all(engine, checkfirst=False)
+    return "\n".join(statements)
+
+
+def test_create_all_installs_rating_trigger_on_postgresql():
+    ddl = _create_all_ddl("postgresql+asyncpg://")
+
+    assert "CREATE OR REPLACE FUNCTION recalc_product_rating" in ddl
+    assert "CREATE OR REPLACE FUNCTION reviews_update_product_rating" in ddl
+    assert "CREATE TRIGGER trg_reviews_product_rating" in ddl
+    # Триггер создаётся после таблицы reviews
+    assert ddl.index("CREATE TABLE reviews") < ddl.index("CREATE TRIGGER")
+
+
+def test_create_all_skips_rating_trigger_on_other_dialects():
+    ddl = _create_all_ddl("sqlite://")
+
+    assert "CREATE TABLE reviews" in ddl
+    assert "recalc_product_rating" not in ddl
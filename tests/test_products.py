@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import update
+
+from app.models import Category as CategoryModel, Product as ProductModel
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_delete_product_marks_own_product_inactive(client, seed, login, session_maker):
+    login(seed.seller)
+
+    response = await client.delete(f"/products/{seed.product.id}")
+
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+    async with session_maker() as session:
+        product = await session.get(ProductModel, seed.product.id)
+        assert product.is_active is False
+
+
+async def test_delete_product_of_another_seller_returns_403(client, seed, login, session_maker):
+    login(seed.other_seller)
+
+    response = await client.delete(f"/products/{seed.product.id}")
+
+    assert response.status_code == 403
+    async with session_maker() as session:
+        product = await session.get(ProductModel, seed.product.id)
+        assert product.is_active is True
+
+
+async def test_delete_missing_product_returns_404(client, seed, login):
+    login(seed.seller)
+
+    response = await client.delete("/products/999")
+
+    assert response.status_code == 404
+
+
+async def test_delete_product_in_inactive_category_returns_404(client, seed, login, session_maker):
+    async with session_maker() as session:
+        await session.execute(
+            update(CategoryModel)
+            .where(CategoryModel.id == seed.category.id)
+            .values(is_active=False)
+        )
+        await session.commit()
+    login(seed.seller)
+
+    response = await client.delete(f"/products/{seed.product.id}")
+
+    assert response.status_code == 404
@@ -0,0 +1,26 @@
+import pytest
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_review_returns_created_review(client, buyer):
+    response = await client.post(
+        "/reviews/", json={"product_id": 1, "comment": "Great", "grade": 5}
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert isinstance(body["id"], int)
+    assert body["user_id"] == buyer.id
+    assert body["product_id"] == 1
+    assert body["comment"] == "Great"
+    assert body["grade"] == 5
+    assert body["is_active"] is True
+    assert body["comment_date"]
+
+
+async def test_create_review_for_missing_product_returns_404(client):
+    response = await client.post("/reviews/", json={"product_id": 999, "grade": 4})
+
+    assert response.status_code == 404
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db_depends import get_async_session_maker
+from app.main import app
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_empty_listing_streams_empty_array(client):
+    response = await client.get("/reviews/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b"[]"
+
+
+async def test_listing_streams_comma_separated_array(client, seed):
+    for grade in (4, 5):
+        created = await client.post(
+            "/reviews/", json={"product_id": seed.product.id, "grade": grade}
+        )
+        assert created.status_code == 201
+
+    response = await client.get("/reviews/")
+
+    assert response.status_code == 200
+    assert response.content.startswith(b"[{")
+    assert response.content.count(b"},{") == 1
+    assert response.content.endswith(b"}]")
+    assert [review["grade"] for review in json.loads(response.content)] == [4, 5]
+
+
+async def test_products_listing_is_streamed(client, seed):
+    response = await client.get("/products/")
+
+    assert response.status_code == 200
+    assert [product["id"] for product in response.json()] == [seed.product.id]
+
+
+async def test_query_error_is_reported_before_streaming(client):
+    # База без таблиц: запрос падает до начала отправки ответа
+    engine = create_async_engine("sqlite+aiosqlite://")
+    app.dependency_overrides[get_async_session_maker] = lambda: async_sessionmaker(engine)
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/products/")
+    await engine.dispose()
+
+    assert response.status_code == 500